@@ -5,15 +5,18 @@ Coordinates between graph handlers and schema models to generate
 context files for global and repository-specific views.
 """
 
-import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Dict, Any, Optional
 from .model.context_schema import (
     GlobalContext,
     RepositoryContext,
     Dimension,
     DimensionOverride,
-    RepositoryStats
+    RepositoryStats,
+    TopValue,
+    QueryGenerationHints
 )
 from .graphs import get_graph_handler
 from .graphs.base import APPROX_DISTINCT_THRESHOLD
@@ -37,6 +40,54 @@ class ContextBuilder:
         # Load graph handler via registry/factory
         handler_cls = get_graph_handler(graph_id)
         self.graph = handler_cls()
+
+        # Prefixes are fixed per handler; compute once and reuse across
+        # the global and per-repository contexts
+        self._prefixes = self.graph.get_prefixes()
+
+        # Resolve each dimension's name/property fallback once instead of
+        # re-indexing the config dicts in every loop iteration
+        self._dimensions = [
+            SimpleNamespace(name=dc['name'], property=dc.get('property', dc['name']), config=dc)
+            for dc in self.graph.dimensions
+        ]
+
+        # Handler capabilities are fixed per instance; resolve the
+        # query-hints lookups once instead of on every build_global call
+        self._config_query_hints = None
+        if hasattr(self.graph, 'config'):
+            self._config_query_hints = self.graph.config.get('query_hints')
+        self._generate_query_hints = getattr(self.graph, 'generate_query_hints', None)
+
+        # Dedicated writer thread so JSON flushes overlap the next
+        # context's SPARQL queries; build()/flush() drain it
+        self._writer = ThreadPoolExecutor(max_workers=1)
+        self._write_futures = []
+
+    @staticmethod
+    def _write_if_changed(output_path: Path, payload: bytes) -> None:
+        """Write payload unless the file already holds identical content.
+
+        Skipping unchanged files avoids mtime churn that would invalidate
+        downstream caches on every rebuild.
+        """
+        if output_path.exists() and output_path.read_bytes() == payload:
+            return
+        output_path.write_bytes(payload)
+
+    def _write_file(self, output_path: Path, payload: bytes) -> None:
+        """Queue a context file write on the background writer."""
+        self._write_futures.append(self._writer.submit(self._write_if_changed, output_path, payload))
+
+    def flush(self) -> None:
+        """Wait for queued context writes and surface any write errors.
+
+        build() flushes automatically; call this after standalone
+        build_global()/build_repository() use before reading the files.
+        """
+        futures, self._write_futures = self._write_futures, []
+        for future in futures:
+            future.result()
     
     def build(self) -> Dict[str, Path]:
         """
@@ -51,52 +102,70 @@ class ContextBuilder:
         global_path = self.build_global()
         output_files['global'] = global_path
         
-        # Build repository contexts
+        # Build repository contexts concurrently - each build is independent
+        # and dominated by SPARQL round trips, so threads overlap the latency
         repositories = self.graph.get_repositories()
-        for repo in repositories:
-            repo_path = self.build_repository(repo)
-            output_files[repo['id']] = repo_path
-        
+        if repositories:
+            max_workers = min(8, len(repositories))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self.build_repository, repo): repo
+                    for repo in repositories
+                }
+                for future in as_completed(futures):
+                    output_files[futures[future]['id']] = future.result()
+
+        self.flush()
         return output_files
     
+    def _map_dimensions(self, fn) -> list:
+        """Apply fn to every dimension concurrently, preserving order."""
+        if not self._dimensions:
+            return []
+        max_workers = min(8, len(self._dimensions))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fn, self._dimensions))
+
+    def _build_dimension(self, dim: SimpleNamespace, stats: Dict[str, tuple],
+                         repo_filter: Optional[Dict[str, str]] = None) -> Dimension:
+        """Introspect a single dimension into a Dimension model."""
+        coverage, distinct_count = stats[dim.name]
+        top_values = self.graph.get_top_values(dim.config, repo_filter, top_n=10)
+        # Introspection output is trusted, so skip pydantic validation
+        return Dimension.model_construct(
+            name=dim.property,
+            coverage=coverage,
+            approx_distinct_values=distinct_count if distinct_count < APPROX_DISTINCT_THRESHOLD else None,
+            top_values=[TopValue.model_construct(**tv) for tv in top_values] if top_values else None
+        )
+
     def build_global(self) -> Path:
         """Build global context file."""
-        dimensions = []
-        
-        # Introspect each dimension
-        for dim_config in self.graph.dimensions:
-            coverage = self.graph.get_dimension_coverage(dim_config)
-            distinct_count = self.graph.get_distinct_values_count(dim_config)
-            top_values = self.graph.get_top_values(dim_config, top_n=10)
-            
-            dimension = Dimension(
-                name=dim_config.get('property', dim_config['name']),
-                coverage=coverage,
-                approx_distinct_values=distinct_count if distinct_count < APPROX_DISTINCT_THRESHOLD else None,
-                top_values=top_values if top_values else None
-            )
-            dimensions.append(dimension)
-        
-        # Count total datasets
-        total_datasets = self.graph.count_datasets()
-        
+        graph = self.graph
+
+        # Counts for all dimensions come back from one batched query
+        dimension_stats = graph.get_dimension_stats(graph.dimensions)
+
+        # Introspect each dimension; top-value queries are independent per
+        # dimension, so overlap their round trips
+        dimensions = self._map_dimensions(
+            lambda dim: self._build_dimension(dim, dimension_stats))
+
         # Get query hints: from config if present, or auto-generate for ontologies
         query_hints = None
-        if hasattr(self.graph, 'config') and 'query_hints' in self.graph.config:
-            from .model.context_schema import QueryGenerationHints
-            query_hints = QueryGenerationHints(**self.graph.config['query_hints'])
-        elif hasattr(self.graph, 'generate_query_hints'):
+        if self._config_query_hints is not None:
+            query_hints = QueryGenerationHints(**self._config_query_hints)
+        elif self._generate_query_hints is not None:
             # Auto-generate query hints for ontology graphs
-            hints_dict = self.graph.generate_query_hints()
+            hints_dict = self._generate_query_hints()
             if hints_dict:
-                from .model.context_schema import QueryGenerationHints
                 query_hints = QueryGenerationHints(**hints_dict)
         
-        global_context = GlobalContext(
+        global_context = GlobalContext.model_construct(
             graph_id=self.graph_id,
             endpoint=self.graph.endpoint,
             entity_types=self.graph.entity_types,
-            prefixes=self.graph.get_prefixes(),
+            prefixes=self._prefixes,
             dimensions=dimensions,
             text_blurb=self.graph.text_blurb,
             query_hints=query_hints
@@ -104,9 +173,8 @@ class ContextBuilder:
         
         # Write JSON file
         output_path = self.output_dir / f"{self.graph_id}_global.json"
-        with open(output_path, 'w') as f:
-            json.dump(global_context.model_dump(exclude_none=True), f, indent=2)
-        
+        self._write_file(output_path, global_context.model_dump_json(exclude_none=True, indent=2).encode('utf-8'))
+
         return output_path
     
     def build_repository(self, repo: Dict[str, str]) -> Path:
@@ -117,43 +185,42 @@ class ContextBuilder:
         
         # Get repository stats
         total_datasets = self.graph.count_datasets(repo_filter)
-        stats = RepositoryStats(total_datasets=total_datasets)
+        stats = RepositoryStats.model_construct(total_datasets=total_datasets)
         
-        # Build dimension overrides
-        dimension_overrides = {}
-        
-        for dim_config in self.graph.dimensions:
-            dim_name = dim_config['name']
-            
-            # Get repository-specific values
-            coverage = self.graph.get_dimension_coverage(dim_config, repo_filter)
-            distinct_count = self.graph.get_distinct_values_count(dim_config, repo_filter)
-            top_values = self.graph.get_top_values(dim_config, repo_filter, top_n=10)
-            
-            # Only include override if it differs significantly from global
-            # For now, include all overrides
-            override = DimensionOverride(
+        graph = self.graph
+
+        # Counts for all dimensions come back from one batched query
+        dimension_stats = graph.get_dimension_stats(graph.dimensions, repo_filter)
+
+        def _override(dim: SimpleNamespace) -> DimensionOverride:
+            coverage, distinct_count = dimension_stats[dim.name]
+            top_values = graph.get_top_values(dim.config, repo_filter, top_n=10)
+            return DimensionOverride.model_construct(
                 coverage=coverage,
                 approx_distinct_values=distinct_count if distinct_count < APPROX_DISTINCT_THRESHOLD else None,
-                top_values=top_values if top_values else None
+                top_values=[TopValue.model_construct(**tv) for tv in top_values] if top_values else None
             )
-            dimension_overrides[dim_name] = override
-        
-        repository_context = RepositoryContext(
+
+        # Only include override if it differs significantly from global
+        # For now, include all overrides
+        dimension_overrides = dict(
+            zip((dim.name for dim in self._dimensions), self._map_dimensions(_override)))
+
+        repository_context = RepositoryContext.model_construct(
             graph_id=self.graph_id,
             source_id=repo_id,
             inherits_from=f"{self.graph_id}_global",
             repository_filter=repo_filter,
             dimension_overrides=dimension_overrides,
             stats=stats,
-            prefixes=self.graph.get_prefixes(),
+            # Prefixes are inherited from the global context via inherits_from;
+            # omitting them here keeps repository files small
             text_blurb=f"Context for {repo.get('label', repo_id)} repository"
         )
         
         # Write JSON file
         output_path = self.output_dir / f"{self.graph_id}_{repo_id}.json"
-        with open(output_path, 'w') as f:
-            json.dump(repository_context.model_dump(exclude_none=True), f, indent=2)
-        
+        self._write_file(output_path, repository_context.model_dump_json(exclude_none=True, indent=2).encode('utf-8'))
+
         return output_path
 
@@ -13,16 +13,16 @@ This command will:
 4. Write the JSON files to dist/context/
 """
 
+import logging
+
 import click
 from pathlib import Path
-from .builder import ContextBuilder
-from .graphs import get_graph_handler
 
 
 @click.group()
 def cli():
     """OmniGraph Context Builder - Generate JSON context files for knowledge graphs."""
-    pass
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
 
 
 @cli.command()
@@ -44,6 +44,10 @@ def build(graph_id: str, output_dir: Path):
         omnigraph-context-builder build nde
         python -m omnigraph_agent.context_builder.cli build nde
     """
+    # Imported here so `--help` and unrelated subcommands don't pay for
+    # the SPARQL/pydantic import chain
+    from .builder import ContextBuilder
+
     click.echo(f"Building context files for graph: {graph_id}")
     click.echo(f"Output directory: {output_dir}")
     
@@ -84,6 +88,8 @@ def introspect(graph_id: str, output: Path, properties_limit: int):
         omnigraph-context-builder introspect nde
         omnigraph-context-builder introspect nde --output suggested_config.yaml
     """
+    from .graphs import get_graph_handler
+
     click.echo(f"Introspecting graph: {graph_id}")
     
     try:
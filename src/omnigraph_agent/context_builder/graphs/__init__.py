@@ -1,23 +1,27 @@
 """Graph handlers registry."""
 
-from typing import Dict, Type
+from importlib import import_module
+from typing import Dict
 
-from .nde import NDEGraph
-from .vbo import VBOGraph
-from .mondo import MONDOGraph
-
-# Map graph_id to handler class for easy extensibility
-GRAPH_HANDLERS: Dict[str, Type] = {
-    "nde": NDEGraph,
-    "vbo": VBOGraph,
-    "mondo": MONDOGraph,
+# Map graph_id to "module:class" so importing the package doesn't pull in
+# every handler; classes are resolved on first lookup
+GRAPH_HANDLERS: Dict[str, str] = {
+    "nde": ".nde:NDEGraph",
+    "vbo": ".vbo:VBOGraph",
+    "mondo": ".mondo:MONDOGraph",
 }
 
+_resolved: Dict[str, type] = {}
+
 
 def get_graph_handler(graph_id: str):
     """Return the graph handler class for the given graph_id."""
-    handler_cls = GRAPH_HANDLERS.get(graph_id)
+    handler_cls = _resolved.get(graph_id)
     if handler_cls is None:
-        raise ValueError(f"Unknown graph_id: {graph_id}")
+        spec = GRAPH_HANDLERS.get(graph_id)
+        if spec is None:
+            raise ValueError(f"Unknown graph_id: {graph_id}")
+        module_name, class_name = spec.split(':')
+        handler_cls = getattr(import_module(module_name, __package__), class_name)
+        _resolved[graph_id] = handler_cls
     return handler_cls
-
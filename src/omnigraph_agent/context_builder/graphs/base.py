@@ -7,13 +7,43 @@ that can be used across different knowledge graphs.
 
 APPROX_DISTINCT_THRESHOLD = 10000
 
+import logging
+import threading
 import yaml
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from SPARQLWrapper import SPARQLWrapper, JSON
 from urllib.parse import urlparse
 
+try:
+    # libyaml parses config files an order of magnitude faster when present
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=128)
+def _expand_property_cached(property_name: str) -> str:
+    """Expand a property name to a full IRI (cached; pure string work)."""
+    if property_name.startswith('<') and property_name.endswith('>'):
+        return property_name  # Already expanded
+    if property_name.startswith('http'):
+        return f"<{property_name}>"  # Full IRI without brackets
+    if ':' in property_name:
+        # Prefixed name - expand to full IRI
+        prefix, local = property_name.split(':', 1)
+        if prefix == 'schema':
+            return f"<http://schema.org/{local}>"
+        elif prefix == 'rdf':
+            return f"<http://www.w3.org/1999/02/22-rdf-syntax-ns#{local}>"
+        # Unknown prefix - return as-is (might work with PREFIX)
+        return property_name
+    return property_name
+
 
 class BaseGraph(ABC):
     """Base class for graph handlers."""
@@ -30,7 +60,7 @@ class BaseGraph(ABC):
             if config_path is None:
                 raise ValueError("Either config_path or config must be provided")
             with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YamlLoader)
         
         self.config = config
         self.endpoint = self.config['endpoint']
@@ -44,44 +74,78 @@ class BaseGraph(ABC):
         self.named_graph = self.config.get('named_graph')
         self.namespace_scope = self.config.get('namespace_scope')
         
-        self.sparql = SPARQLWrapper(self.endpoint)
-        self.sparql.setReturnFormat(JSON)
-    
+        # SPARQLWrapper mutates per-query state (setQuery), so each thread
+        # gets its own wrapper; see the `sparql` property
+        self._thread_local = threading.local()
+
+        # Entity-type filter clauses only depend on entity_types (fixed per
+        # handler), so build each variant once and reuse across queries
+        self._entity_filter_cache: Dict[str, str] = {}
+
+        # Query results keyed by query text. Identical queries recur during a
+        # build (e.g. the unfiltered dataset count is re-issued once per
+        # dimension by get_dimension_coverage), so cache hits skip the
+        # endpoint round trip entirely.
+        self._query_cache: Dict[str, List[Dict[str, Any]]] = {}
+
+    @property
+    def sparql(self) -> SPARQLWrapper:
+        """Thread-local SPARQLWrapper client for this handler's endpoint."""
+        sparql = getattr(self._thread_local, 'sparql', None)
+        if sparql is None:
+            sparql = SPARQLWrapper(self.endpoint)
+            sparql.setReturnFormat(JSON)
+            self._thread_local.sparql = sparql
+        return sparql
+
+    def _run_query(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Execute a SPARQL query and return its result bindings.
+
+        Results are cached per query text for the lifetime of the handler,
+        so repeated identical queries cost a single round trip.
+        """
+        cached = self._query_cache.get(query)
+        if cached is not None:
+            return cached
+        sparql = self.sparql
+        sparql.setQuery(query)
+        results = sparql.query().convert()
+        bindings = results['results']['bindings']
+        self._query_cache[query] = bindings
+        return bindings
+
     def _expand_property(self, property_name: str) -> str:
         """
         Expand a property name to full IRI.
-        
+
         Args:
             property_name: Property name like "schema:name" or full IRI
-        
+
         Returns:
             Full IRI in angle brackets
         """
-        if property_name.startswith('<') and property_name.endswith('>'):
-            return property_name  # Already expanded
-        if property_name.startswith('http'):
-            return f"<{property_name}>"  # Full IRI without brackets
-        if ':' in property_name:
-            # Prefixed name - expand to full IRI
-            prefix, local = property_name.split(':', 1)
-            if prefix == 'schema':
-                return f"<http://schema.org/{local}>"
-            elif prefix == 'rdf':
-                return f"<http://www.w3.org/1999/02/22-rdf-syntax-ns#{local}>"
-            # Unknown prefix - return as-is (might work with PREFIX)
-            return property_name
-        return property_name
-    
+        return _expand_property_cached(property_name)
+
     def _get_entity_type_filter(self, entity_var: str = "?entity") -> str:
         """
         Generate entity type filter clause for queries.
-        
+
         Args:
             entity_var: Variable name to use for entity (default: "?entity")
-        
+
         Returns SPARQL pattern like "?entity a schema:Dataset ." or
         "?entity a ?type . FILTER (?type IN (...))" for multiple types.
         """
+        cached = self._entity_filter_cache.get(entity_var)
+        if cached is not None:
+            return cached
+        clause = self._build_entity_type_filter(entity_var)
+        self._entity_filter_cache[entity_var] = clause
+        return clause
+
+    def _build_entity_type_filter(self, entity_var: str) -> str:
+        """Build the entity type filter clause for a given variable."""
         if not self.entity_types:
             return f"{entity_var} a ?type ."  # Generic fallback
         
@@ -136,11 +200,10 @@ class BaseGraph(ABC):
             }
             LIMIT 100
             """
-            self.sparql.setQuery(query)
-            results = self.sparql.query().convert()
-            
+            bindings = self._run_query(query)
+
             graphs = []
-            for binding in results['results']['bindings']:
+            for binding in bindings:
                 graph_uri = binding['g']['value']
                 graphs.append(graph_uri)
             
@@ -196,8 +259,13 @@ class BaseGraph(ABC):
             return f'FILTER STRSTARTS(STR({entity_var}), "{self.namespace_scope}")'
         return ""
     
+    @lru_cache(maxsize=None)
     def get_repository_filter(self, repo_id: str, repo_uri: str) -> Dict[str, str]:
-        """Generate repository filter dictionary for a specific repository."""
+        """Generate repository filter dictionary for a specific repository.
+
+        Memoized per (repo_id, repo_uri); callers treat the result as
+        read-only.
+        """
         return {
             self.repo_filter_property: repo_uri
         }
@@ -284,11 +352,10 @@ class BaseGraph(ABC):
         }}
         """
         
-        self.sparql.setQuery(query)
-        results = self.sparql.query().convert()
-        
-        if results['results']['bindings']:
-            return int(results['results']['bindings'][0]['count']['value'])
+        bindings = self._run_query(query)
+
+        if bindings:
+            return int(bindings[0]['count']['value'])
         return 0
     
     def get_dimension_coverage(self, dimension: Dict[str, Any], 
@@ -331,11 +398,10 @@ class BaseGraph(ABC):
         }}
         """
         
-        self.sparql.setQuery(query)
-        results = self.sparql.query().convert()
-        
-        if results['results']['bindings']:
-            with_dimension = int(results['results']['bindings'][0]['count']['value'])
+        bindings = self._run_query(query)
+
+        if bindings:
+            with_dimension = int(bindings[0]['count']['value'])
             return with_dimension / total if total > 0 else 0.0
         
         return 0.0
@@ -378,13 +444,81 @@ class BaseGraph(ABC):
         LIMIT {limit}
         """
         
-        self.sparql.setQuery(query)
-        results = self.sparql.query().convert()
-        
-        if results['results']['bindings']:
-            return int(results['results']['bindings'][0]['count']['value'])
+        bindings = self._run_query(query)
+
+        if bindings:
+            return int(bindings[0]['count']['value'])
         return 0
     
+    def get_dimension_stats(self, dimensions: List[Dict[str, Any]],
+                            repository_filter: Optional[Dict[str, str]] = None) -> Dict[str, tuple]:
+        """
+        Compute coverage and distinct-value counts for all dimensions in a
+        single SPARQL query.
+
+        Batches the per-dimension counts that get_dimension_coverage and
+        get_distinct_values_count would otherwise issue as 2N separate
+        round trips into one UNION query grouped by dimension name.
+
+        Returns:
+            Dict mapping dimension name to (coverage, distinct_count).
+        """
+        if not dimensions:
+            return {}
+
+        total = self.count_datasets(repository_filter)
+
+        filter_clause = ""
+        if repository_filter:
+            prop = list(repository_filter.keys())[0]
+            value = list(repository_filter.values())[0]
+            prop_expanded = self._expand_property(prop)
+            filter_clause = f"?entity {prop_expanded} <{value}> ."
+
+        entity_filter = self._get_entity_type_filter("?entity")
+
+        branches = []
+        for dimension in dimensions:
+            property_iri = dimension.get('property')
+            property_iri_expanded = self._expand_property(property_iri)
+            filter_expr = dimension.get('filter', '').strip()
+            value_filter = f"?value {filter_expr} ." if filter_expr else ""
+
+            branches.append(f"""{{
+                BIND("{dimension['name']}" AS ?dim)
+                {entity_filter}
+                {filter_clause}
+                ?entity {property_iri_expanded} ?value .
+                {value_filter}
+            }}""")
+
+        query = f"""
+        PREFIX schema: <http://schema.org/>
+        PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
+
+        SELECT ?dim (COUNT(DISTINCT ?entity) as ?entities) (COUNT(DISTINCT ?value) as ?distinct)
+        WHERE {{
+            {" UNION ".join(branches)}
+        }}
+        GROUP BY ?dim
+        """
+
+        bindings = self._run_query(query)
+
+        stats = {}
+        for binding in bindings:
+            dim_name = binding['dim']['value']
+            with_dimension = int(binding['entities']['value'])
+            distinct_count = int(binding['distinct']['value'])
+            coverage = with_dimension / total if total > 0 else 0.0
+            stats[dim_name] = (coverage, distinct_count)
+
+        # Dimensions absent from the results matched no entities
+        for dimension in dimensions:
+            stats.setdefault(dimension['name'], (0.0, 0))
+
+        return stats
+
     def get_top_values(self, dimension: Dict[str, Any],
                       repository_filter: Optional[Dict[str, str]] = None,
                       top_n: int = 10) -> List[Dict[str, Any]]:
@@ -425,11 +559,10 @@ class BaseGraph(ABC):
         LIMIT {top_n}
         """
         
-        self.sparql.setQuery(query)
-        results = self.sparql.query().convert()
-        
+        bindings = self._run_query(query)
+
         top_values = []
-        for binding in results['results']['bindings']:
+        for binding in bindings:
             value = binding['value']['value']
             count = int(binding['count']['value'])
             top_values.append({
@@ -463,11 +596,10 @@ class BaseGraph(ABC):
         LIMIT {limit}
         """
         
-        self.sparql.setQuery(query)
-        results = self.sparql.query().convert()
-        
+        bindings = self._run_query(query)
+
         properties = []
-        for binding in results['results']['bindings']:
+        for binding in bindings:
             prop_uri = binding['property']['value']
             count = int(binding['count']['value'])
             sample_value = binding.get('sample_value', {}).get('value', '')
@@ -502,11 +634,10 @@ class BaseGraph(ABC):
         LIMIT {limit}
         """
         
-        self.sparql.setQuery(query)
-        results = self.sparql.query().convert()
-        
+        bindings = self._run_query(query)
+
         types = []
-        for binding in results['results']['bindings']:
+        for binding in bindings:
             type_uri = binding['type']['value']
             types.append(type_uri)
         
@@ -532,11 +663,10 @@ class BaseGraph(ABC):
         LIMIT {limit}
         """
         
-        self.sparql.setQuery(query)
-        results = self.sparql.query().convert()
-        
+        bindings = self._run_query(query)
+
         repo_properties = []
-        for binding in results['results']['bindings']:
+        for binding in bindings:
             prop_uri = binding['property']['value']
             count = int(binding['count']['value'])
             sample_catalog = binding.get('sample_catalog', {}).get('value', '')
@@ -559,18 +689,18 @@ class BaseGraph(ABC):
         
         Returns a dict that can be written to YAML.
         """
-        print(f"Introspecting {self.graph_id} graph...")
+        logger.info("Introspecting %s graph...", self.graph_id)
         
         # Discover properties
-        print("  Discovering properties...")
+        logger.info("  Discovering properties...")
         properties = self.introspect_properties(limit=properties_limit)
         
         # Discover entity types
-        print("  Discovering entity types...")
+        logger.info("  Discovering entity types...")
         entity_types = self.introspect_entity_types(limit=20)
         
         # Discover repository properties
-        print("  Discovering repository properties...")
+        logger.info("  Discovering repository properties...")
         repo_properties = self.introspect_repository_properties(limit=10)
         
         # Find most likely repo filter property
@@ -621,7 +751,7 @@ class BaseGraph(ABC):
         if output_path:
             with open(output_path, 'w') as f:
                 yaml.dump(config, f, default_flow_style=False, sort_keys=False)
-            print(f"  Suggested config written to {output_path}")
+            logger.info("  Suggested config written to %s", output_path)
         
         return config
     
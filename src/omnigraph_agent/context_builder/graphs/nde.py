@@ -40,11 +40,10 @@ class NDEGraph(KnowledgeGraph):
         ORDER BY ?label
         """
         
-        self.sparql.setQuery(query)
-        results = self.sparql.query().convert()
-        
+        bindings = self._run_query(query)
+
         repositories = []
-        for binding in results['results']['bindings']:
+        for binding in bindings:
             catalog_uri = binding['catalog']['value']
             # Extract repository ID from URI (e.g., last segment or domain)
             repo_id = self._extract_repo_id(catalog_uri)
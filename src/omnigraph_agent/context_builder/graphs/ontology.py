@@ -5,9 +5,12 @@ Ontologies are single-source knowledge structures (e.g., MONDO, VBO)
 that don't have multiple data repositories/catalogs.
 """
 
+import logging
 from typing import List, Dict, Any, Optional
 from .base import BaseGraph
 
+logger = logging.getLogger(__name__)
+
 
 class OntologyGraph(BaseGraph):
     """Base class for ontology graph handlers."""
@@ -61,11 +64,10 @@ class OntologyGraph(BaseGraph):
         LIMIT {limit}
         """
         
-        self.sparql.setQuery(query)
-        results = self.sparql.query().convert()
-        
+        bindings = self._run_query(query)
+
         properties = []
-        for binding in results['results']['bindings']:
+        for binding in bindings:
             prop_uri = binding['prop']['value']
             count = int(binding['count']['value'])
             extracted_id = id_extractor(prop_uri)
@@ -160,11 +162,10 @@ class OntologyGraph(BaseGraph):
         """
         
         try:
-            self.sparql.setQuery(query)
-            results = self.sparql.query().convert()
-            
+            bindings = self._run_query(query)
+
             annotations = []
-            for binding in results['results']['bindings']:
+            for binding in bindings:
                 prop_uri = binding['annot_prop']['value']
                 count = int(binding['count']['value'])
                 # Extract short name
@@ -179,7 +180,7 @@ class OntologyGraph(BaseGraph):
             return annotations
         except Exception as e:
             # Query may timeout on large ontologies - return empty list
-            print(f"  Warning: Axiom annotation introspection timed out or failed: {e}")
+            logger.warning("Axiom annotation introspection timed out or failed: %s", e)
             return []
     
     def introspect_owl_restrictions(self, limit: int = 20) -> List[Dict[str, Any]]:
@@ -228,11 +229,10 @@ class OntologyGraph(BaseGraph):
         """
         
         try:
-            self.sparql.setQuery(query)
-            results = self.sparql.query().convert()
-            
+            bindings = self._run_query(query)
+
             restrictions = []
-            for binding in results['results']['bindings']:
+            for binding in bindings:
                 prop_uri = binding['obo_prop']['value']
                 count = int(binding['count']['value'])
                 sample_quant = binding.get('sample_quant', {}).get('value', '')
@@ -268,7 +268,7 @@ class OntologyGraph(BaseGraph):
             return restrictions
         except Exception as e:
             # Query may timeout on large ontologies - return empty list
-            print(f"  Warning: OWL restriction introspection timed out or failed: {e}")
+            logger.warning("OWL restriction introspection timed out or failed: %s", e)
             return []
     
     def _get_obo_pattern_name(self, ontology_prefix: str, property_id: str) -> Optional[str]:
@@ -455,7 +455,7 @@ class OntologyGraph(BaseGraph):
                             query_patterns[direct_pattern_name] = f"?class {ontology_prefix}:{prop_id} ?value ."
         except Exception as e:
             # If introspection fails, continue without axiom annotation patterns
-            print(f"  Warning: Failed to process axiom annotations: {e}")
+            logger.warning("Failed to process axiom annotations: %s", e)
             pass
         
         # Try to introspect OWL restrictions (axiomatized patterns)
@@ -500,7 +500,7 @@ class OntologyGraph(BaseGraph):
                             query_patterns[f'{ontology_prefix.lower()}_value_{property_id}'] = pattern
         except Exception as e:
             # If introspection fails, continue without restriction patterns
-            print(f"  Warning: Failed to generate restriction patterns: {e}")
+            logger.warning("Failed to generate restriction patterns: %s", e)
             pass
         
         if query_patterns:
@@ -523,6 +523,6 @@ class OntologyGraph(BaseGraph):
         try:
             return QueryGenerationHints(**hints).model_dump(exclude_none=True)
         except Exception as e:
-            print(f"  Warning: Failed to generate query hints: {e}")
+            logger.warning("Failed to generate query hints: %s", e)
             return None
 
@@ -99,7 +99,10 @@ class RepositoryContext(BaseModel):
         description="Repository-specific dimension overrides"
     )
     stats: Optional[RepositoryStats] = Field(None, description="Repository statistics")
-    prefixes: Dict[str, str] = Field(default_factory=dict, description="Prefix to IRI mappings used in this context")
+    prefixes: Optional[Dict[str, str]] = Field(
+        None,
+        description="Prefix to IRI mappings; omitted when inherited from the global context"
+    )
     text_blurb: Optional[str] = Field(None, description="Human-readable description of the repository")
     query_hints: Optional[QueryGenerationHints] = Field(
         None,